@@ -1,15 +1,30 @@
 """A python UI framework for command-line applications using curses."""
 
 from .attribute_mask import AttributeMask
+from .input_reader import InputReader, KeyDecoder, KeyEvent, MouseEvent, PasteEvent
 from .logger import Logger, LogLevel
+from .style_sheet import Style, StyleSheet
 from .window import Window
 
-from .session import Session  # uses Logger, Window
+from .session import Session  # uses InputReader, Logger, StyleSheet, Window
+from .table import Column, Table  # uses AttributeMask, StyleSheet, Window
+from .render_server import RenderClient, RenderServer  # uses Session
 
 __all__ = [
     "AttributeMask",
+    "Column",
+    "InputReader",
+    "KeyDecoder",
+    "KeyEvent",
     "Logger",
     "LogLevel",
+    "MouseEvent",
+    "PasteEvent",
+    "RenderClient",
+    "RenderServer",
     "Session",
+    "Style",
+    "StyleSheet",
+    "Table",
     "Window",
 ]
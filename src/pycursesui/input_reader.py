@@ -0,0 +1,466 @@
+"""Define the InputReader and KeyDecoder classes, along with the events they produce."""
+
+import codecs
+import os
+import re
+import select
+import sys
+
+from pycursesui import time
+from typing import Dict, List, Tuple
+
+__all__ = ["InputReader", "KeyDecoder", "KeyEvent", "MouseEvent", "PasteEvent"]
+
+
+########################################################################################################################
+
+ESCAPE = 0x1b
+ESCAPE_DELAY = 0.025
+READ_SIZE = 65536
+
+PASTE_END = b"\x1b[201~"
+PASTE_START = b"\x1b[200~"
+
+MOUSE_PREFIX = b"\x1b[<"
+MOUSE_PATTERN = re.compile(rb"\x1b\[<(\d+);(\d+);(\d+)([Mm])")
+MOUSE_PARTIAL_PATTERN = re.compile(rb"\x1b\[<[\d;]*$")
+
+CSI_PREFIX = b"\x1b["
+CSI_PATTERN = re.compile(rb"\x1b\[[\x30-\x3f]*[\x20-\x2f]*[\x40-\x7e]")
+CSI_PARTIAL_PATTERN = re.compile(rb"\x1b\[[\x30-\x3f]*[\x20-\x2f]*$")
+MODIFIED_KEY_PATTERN = re.compile(rb"\x1b\[(\d+);(\d+)([~A-Z])")
+
+TERMINAL_MOUSE_OFF = "\x1b[?1006l\x1b[?1003l"
+TERMINAL_MOUSE_ON = "\x1b[?1003h\x1b[?1006h"
+TERMINAL_PASTE_OFF = "\x1b[?2004l"
+TERMINAL_PASTE_ON = "\x1b[?2004h"
+
+CONTROL_KEYS = {
+    "\x00": "ctrl+space",
+    "\x08": "backspace",
+    "\t": "tab",
+    "\n": "enter",
+    "\r": "enter",
+    "\x7f": "backspace",
+}
+
+SEQUENCES = {
+    b"\x1b[A": "up",
+    b"\x1b[B": "down",
+    b"\x1b[C": "right",
+    b"\x1b[D": "left",
+    b"\x1b[F": "end",
+    b"\x1b[H": "home",
+    b"\x1b[Z": "shift+tab",
+    b"\x1b[1~": "home",
+    b"\x1b[2~": "insert",
+    b"\x1b[3~": "delete",
+    b"\x1b[4~": "end",
+    b"\x1b[5~": "page_up",
+    b"\x1b[6~": "page_down",
+    b"\x1b[11~": "f1",
+    b"\x1b[12~": "f2",
+    b"\x1b[13~": "f3",
+    b"\x1b[14~": "f4",
+    b"\x1b[15~": "f5",
+    b"\x1b[17~": "f6",
+    b"\x1b[18~": "f7",
+    b"\x1b[19~": "f8",
+    b"\x1b[20~": "f9",
+    b"\x1b[21~": "f10",
+    b"\x1b[23~": "f11",
+    b"\x1b[24~": "f12",
+    b"\x1bOA": "up",
+    b"\x1bOB": "down",
+    b"\x1bOC": "right",
+    b"\x1bOD": "left",
+    b"\x1bOF": "end",
+    b"\x1bOH": "home",
+    b"\x1bOP": "f1",
+    b"\x1bOQ": "f2",
+    b"\x1bOR": "f3",
+    b"\x1bOS": "f4",
+}
+
+_LEAF = None
+
+
+########################################################################################################################
+
+class KeyEvent(object):
+    """
+    KeyEvent describes a single key press: either a printable character or a named key like "up" or "ctrl+c".
+
+    Modifiers which the terminal reports separately from the key (e.g., xterm's ctrl+up, sent as "\\x1b[1;5A") are
+    given by the alt, ctrl, and shift flags rather than being folded into the key's name.
+    """
+
+    def __init__(self, key: str, alt: bool=False, ctrl: bool=False, shift: bool=False):
+        """Create a new KeyEvent."""
+        self.alt = alt
+        self.ctrl = ctrl
+        self.key = key
+        self.shift = shift
+
+    def __eq__(self, other) -> bool:
+        """Determine whether this event describes the same key press as another."""
+        return isinstance(other, KeyEvent) and self._fields() == other._fields()
+
+    def __repr__(self) -> str:
+        """Get a debugging representation of this event."""
+        return f"KeyEvent({self.key!r}, alt={self.alt}, ctrl={self.ctrl}, shift={self.shift})"
+
+    def _fields(self) -> Tuple:
+        return (self.key, self.alt, self.ctrl, self.shift)
+
+
+class MouseEvent(object):
+    """
+    MouseEvent describes a mouse button, wheel, or motion report at a given cell of the screen.
+
+    Buttons are numbered 1 to 3 for left, middle, and right, 4 and 5 for the wheel moving up and down, and 0 for
+    motion with no button held.
+    """
+
+    def __init__(self, x: int, y: int, button: int, pressed: bool=True, motion: bool=False, modifiers: int=0):
+        """Create a new MouseEvent."""
+        self.button = button
+        self.modifiers = modifiers
+        self.motion = motion
+        self.pressed = pressed
+        self.x = x
+        self.y = y
+
+    def __eq__(self, other) -> bool:
+        """Determine whether this event describes the same mouse report as another."""
+        return isinstance(other, MouseEvent) and self._fields() == other._fields()
+
+    def __repr__(self) -> str:
+        """Get a debugging representation of this event."""
+        return (f"MouseEvent({self.x}, {self.y}, {self.button}, pressed={self.pressed}, motion={self.motion}, "
+                f"modifiers={self.modifiers})")
+
+    def _fields(self) -> Tuple:
+        return (self.x, self.y, self.button, self.pressed, self.motion, self.modifiers)
+
+
+class PasteEvent(object):
+    """PasteEvent holds the entire text of a bracketed paste."""
+
+    def __init__(self, text: str):
+        """Create a new PasteEvent."""
+        self.text = text
+
+    def __eq__(self, other) -> bool:
+        """Determine whether this event holds the same text as another."""
+        return isinstance(other, PasteEvent) and self.text == other.text
+
+    def __repr__(self) -> str:
+        """Get a debugging representation of this event."""
+        return f"PasteEvent({self.text!r})"
+
+
+########################################################################################################################
+
+class KeyDecoder(object):
+    """
+    KeyDecoder converts raw terminal input bytes into key, mouse, and paste events.
+
+    Escape sequences are matched by walking a trie built from a table of known sequences. Bytes which might be the
+    start of a longer sequence are held back until more input arrives, or until `decode` is called with `final=True`.
+    The body of a bracketed paste is collected chunk by chunk until its end marker arrives, and bursts of mouse motion
+    are coalesced so only the latest position is reported.
+    """
+
+    def __init__(self, sequences: Dict[bytes, str]=None):
+        """
+        Create a new KeyDecoder.
+
+        Arguments:
+            sequences: a map of escape sequences to key names (defaults to the common xterm sequences)
+        """
+        self._paste_chunks = None
+        self._paste_tail = b""
+        self._pending = b""
+        self._text_decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._trie = self._build_trie(sequences if sequences is not None else SEQUENCES)
+
+    # Properties ###################################################################################
+
+    @property
+    def has_pending(self) -> bool:
+        """Get whether some input is being held back as a possibly incomplete escape sequence."""
+        return len(self._pending) > 0
+
+    # Public Methods ###############################################################################
+
+    def decode(self, data: bytes, final: bool=False) -> List[object]:
+        """
+        Decode a chunk of input into a list of events.
+
+        Arguments:
+            data: the bytes read from the terminal
+            final: whether to treat any incomplete escape sequence as complete (e.g., after an input timeout)
+        """
+        events = []
+        if self._paste_chunks is not None:
+            data = self._continue_paste(data, events)
+            if data is None:
+                return events
+
+        data = self._pending + data
+        self._pending = b""
+
+        index, length = 0, len(data)
+        while index < length:
+            if data.startswith(PASTE_START, index):
+                self._paste_chunks, self._paste_tail = [], b""
+                data = self._continue_paste(data[index + len(PASTE_START):], events)
+                if data is None:
+                    break
+                index, length = 0, len(data)
+                continue
+
+            if data[index] != ESCAPE:
+                end = data.find(b"\x1b", index)
+                end = end if end >= 0 else length
+                self._decode_text(data[index:end], events)
+                index = end
+                continue
+
+            event, end = self._decode_escape(data, index, final)
+            if end is None:
+                self._pending = data[index:]
+                break
+
+            if event is not None:
+                self._append(events, event)
+            index = end
+
+        return events
+
+    # Private Methods ##############################################################################
+
+    def _append(self, events: List[object], event: object):
+        if isinstance(event, MouseEvent) and event.motion and events:
+            last = events[-1]
+            if isinstance(last, MouseEvent) and last.motion and last.button == event.button and \
+                    last.modifiers == event.modifiers:
+                events[-1] = event
+                return
+
+        events.append(event)
+
+    def _build_trie(self, sequences: Dict[bytes, str]) -> dict:
+        trie = {}
+        for sequence, name in sequences.items():
+            node = trie
+            for byte in sequence:
+                node = node.setdefault(byte, {})
+            node[_LEAF] = name
+        return trie
+
+    def _continue_paste(self, data: bytes, events: List[object]) -> bytes:
+        # only the new data is searched, plus the few bytes before it in case the end marker was split between reads
+        tail = self._paste_tail
+        split_end = (tail + data[0:len(PASTE_END) - 1]).find(PASTE_END)
+        end = split_end - len(tail) if split_end >= 0 else data.find(PASTE_END)
+
+        if (split_end < 0) and (end < 0):
+            self._paste_chunks.append(data)
+            self._paste_tail = (tail + data[-(len(PASTE_END) - 1):])[-(len(PASTE_END) - 1):]
+            return None
+
+        content = b"".join(self._paste_chunks) + data[0:max(end, 0)]
+        if end < 0:
+            content = content[0:end]
+        self._paste_chunks, self._paste_tail = None, b""
+
+        self._append(events, PasteEvent(content.decode("utf-8", errors="replace")))
+        return data[end + len(PASTE_END):]
+
+    def _decode_escape(self, data: bytes, index: int, final: bool) -> Tuple[object, int]:
+        if data.startswith(MOUSE_PREFIX, index):
+            match = MOUSE_PATTERN.match(data, index)
+            if match is not None:
+                return self._decode_mouse(match), match.end()
+            if (not final) and MOUSE_PARTIAL_PATTERN.match(data, index):
+                return None, None
+
+        node, end, name, name_end = self._trie, index, None, None
+        while end < len(data) and data[end] in node:
+            node = node[data[end]]
+            end += 1
+            if _LEAF in node:
+                name, name_end = node[_LEAF], end
+
+        if (end == len(data)) and (len(node) > (1 if _LEAF in node else 0)) and not final:
+            return None, None
+        if name is not None:
+            return KeyEvent(name), name_end
+
+        if data.startswith(CSI_PREFIX, index):
+            match = CSI_PATTERN.match(data, index)
+            if match is not None:
+                return self._decode_modified_key(match.group(0)), match.end()  # an unrecognized sequence is ignored
+            if (not final) and CSI_PARTIAL_PATTERN.match(data, index):
+                return None, None
+
+        if index + 1 < len(data) and data[index + 1] < 0x80 and data[index + 1] not in (ESCAPE, ord("["), ord("O")):
+            events = []
+            self._decode_text(data[index + 1:index + 2], events)
+            if len(events) == 1:
+                events[0].alt = True
+                return events[0], index + 2
+
+        return KeyEvent("escape"), index + 1
+
+    def _decode_modified_key(self, sequence: bytes) -> KeyEvent:
+        # xterm reports a modified key by adding a ";<1 + modifier bits>" parameter to its plain sequence, so the
+        # plain sequence is looked up to find the key's name (letter keys may be plain "\x1b[A" or "\x1bOA")
+        match = MODIFIED_KEY_PATTERN.fullmatch(sequence)
+        if match is None:
+            return None
+
+        number, modifiers, final = match.groups()
+        candidates = [b"\x1b[" + number + b"~"] if final == b"~" else [b"\x1b[" + final, b"\x1bO" + final]
+        for candidate in candidates:
+            name = self._lookup(candidate)
+            if name is not None:
+                flags = max(int(modifiers) - 1, 0)
+                return KeyEvent(name, alt=bool(flags & 0x02), ctrl=bool(flags & 0x04), shift=bool(flags & 0x01))
+        return None
+
+    def _decode_mouse(self, match) -> MouseEvent:
+        code, x, y = int(match.group(1)), int(match.group(2)), int(match.group(3))
+        if code & 0x40:
+            button = (code & 0x03) + 4
+        else:
+            button = (code & 0x03) + 1 if (code & 0x03) != 0x03 else 0
+        return MouseEvent(
+            x - 1,
+            y - 1,
+            button,
+            pressed=(match.group(4) == b"M"),
+            motion=(code & 0x20 != 0),
+            modifiers=(code & 0x1c),
+        )
+
+    def _decode_text(self, data: bytes, events: List[object]):
+        for character in self._text_decoder.decode(data):
+            if character in CONTROL_KEYS:
+                events.append(KeyEvent(CONTROL_KEYS[character]))
+            elif character < " ":
+                events.append(KeyEvent(f"ctrl+{chr(ord(character) + 96)}"))
+            else:
+                events.append(KeyEvent(character))
+
+    def _lookup(self, sequence: bytes) -> str:
+        node = self._trie
+        for byte in sequence:
+            node = node.get(byte)
+            if node is None:
+                return None
+        return node.get(_LEAF)
+
+
+########################################################################################################################
+
+class InputReader(object):
+    """
+    InputReader reads every byte available from the terminal at once and decodes it into a batch of events.
+
+    This replaces calling `getch` once per byte: each call to `read_events` performs a single `select` followed by as
+    few `read` calls as the pending input requires, so a large paste or a burst of mouse motion is handled in one pass.
+    """
+
+    def __init__(self, fd: int=None, decoder: KeyDecoder=None, escape_delay: float=ESCAPE_DELAY):
+        """
+        Create a new InputReader.
+
+        Arguments:
+            fd: the file descriptor to read from (defaults to stdin)
+            decoder: the decoder used to parse the input (defaults to a new KeyDecoder)
+            escape_delay: the number of seconds to wait before treating a lone escape as the escape key
+        """
+        self.decoder = decoder if decoder is not None else KeyDecoder()
+        self.escape_delay = escape_delay
+        self.fd = fd if fd is not None else sys.stdin.fileno()
+
+        self._last_read_time = time.now()
+        self._mouse = False
+        self._output = None
+        self._paste = False
+
+    # Public Methods ###############################################################################
+
+    def read_events(self, timeout: float=0) -> List[object]:
+        """
+        Read all the input currently available and decode it into a list of events.
+
+        If an escape is being held back, the wait is cut short when the escape delay runs out so the escape key is
+        reported on time, and an escape whose delay has already expired is reported before any newer input.
+
+        Arguments:
+            timeout: the number of seconds to wait for input if none is available yet
+        """
+        events = []
+        if self.decoder.has_pending:
+            remaining = self.escape_delay - (time.now() - self._last_read_time)
+            if remaining <= 0:
+                events, timeout = self.decoder.decode(b"", final=True), 0
+            else:
+                timeout = remaining if timeout is None else min(timeout, remaining)
+
+        data = self._read_available(timeout)
+        now = time.now()
+        if data:
+            self._last_read_time = now
+            events.extend(self.decoder.decode(data))
+        elif self.decoder.has_pending and (now - self._last_read_time >= self.escape_delay):
+            events.extend(self.decoder.decode(b"", final=True))
+
+        return events
+
+    def start(self, mouse: bool=False, paste: bool=True, output=None) -> "InputReader":
+        """
+        Ask the terminal to report extra kinds of input.
+
+        Only the reporting asked for is turned on, so a terminal used by code which reads raw bytes elsewhere (e.g.,
+        with `getch`) is left alone unless mouse or paste events are wanted.
+
+        Arguments:
+            mouse: whether to enable SGR mouse reporting (which usually disables the terminal's own text selection)
+            paste: whether to enable bracketed paste
+            output: the stream to write the terminal control sequences to (defaults to stdout)
+        """
+        self._mouse, self._paste = mouse, paste
+        self._output = output if output is not None else sys.stdout
+        self._send((TERMINAL_PASTE_ON if paste else "") + (TERMINAL_MOUSE_ON if mouse else ""))
+        return self
+
+    def stop(self) -> "InputReader":
+        """Restore the terminal's normal input reporting."""
+        if self._output is not None:
+            self._send((TERMINAL_MOUSE_OFF if self._mouse else "") + (TERMINAL_PASTE_OFF if self._paste else ""))
+            self._mouse, self._paste, self._output = False, False, None
+        return self
+
+    # Private Methods ##############################################################################
+
+    def _read_available(self, timeout: float) -> bytes:
+        chunks, size = [], 0
+        readable, _, _ = select.select([self.fd], [], [], timeout)
+        while readable and size < READ_SIZE:
+            chunk = os.read(self.fd, READ_SIZE)
+            if not chunk:
+                break
+            chunks.append(chunk)
+            size += len(chunk)
+            readable, _, _ = select.select([self.fd], [], [], 0)
+        return b"".join(chunks)
+
+    def _send(self, text: str):
+        if text:
+            self._output.write(text)
+            self._output.flush()
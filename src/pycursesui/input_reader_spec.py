@@ -0,0 +1,133 @@
+"""Unit tests for the KeyDecoder and InputReader classes."""
+
+import os
+import sure
+
+from io import StringIO
+from mamba import after, before, description, it
+
+from pycursesui import InputReader, KeyDecoder, KeyEvent, MouseEvent, PasteEvent
+from pycursesui import time
+
+__all__ = []
+assert sure  # prevent linter errors
+
+
+########################################################################################################################
+
+with description("KeyDecoder:", "unit") as self:
+
+    with before.each:
+        self.decoder = KeyDecoder()
+
+    with it("decodes printable and control characters"):
+        self.decoder.decode(b"a\r\x03").should.equal([KeyEvent("a"), KeyEvent("enter"), KeyEvent("ctrl+c")])
+
+    with it("decodes known escape sequences"):
+        self.decoder.decode(b"\x1b[A\x1bOP\x1b[15~").should.equal([KeyEvent("up"), KeyEvent("f1"), KeyEvent("f5")])
+
+    with it("decodes the other forms of the first four function keys"):
+        self.decoder.decode(b"\x1b[11~\x1b[14~").should.equal([KeyEvent("f1"), KeyEvent("f4")])
+
+    with it("decodes the modifiers of modified arrow and function keys"):
+        self.decoder.decode(b"\x1b[1;5A\x1b[1;3D\x1b[15;2~\x1b[1;6P").should.equal([
+            KeyEvent("up", ctrl=True),
+            KeyEvent("left", alt=True),
+            KeyEvent("f5", shift=True),
+            KeyEvent("f1", ctrl=True, shift=True),
+        ])
+
+    with it("ignores modified sequences for unknown keys"):
+        self.decoder.decode(b"\x1b[99;5~x").should.equal([KeyEvent("x")])
+
+    with it("decodes an escape followed by a character as an alt key"):
+        self.decoder.decode(b"\x1bx").should.equal([KeyEvent("x", alt=True)])
+
+    with it("decodes a bracketed paste as a single event"):
+        self.decoder.decode(b"\x1b[200~one\ntwo\x1b[201~").should.equal([PasteEvent("one\ntwo")])
+
+    with it("decodes a bracketed paste split across many reads"):
+        data = b"\x1b[200~" + (b"x" * 1000) + b"\x1b[201~!"
+        events = []
+        for start in range(0, len(data), 7):
+            events.extend(self.decoder.decode(data[start:start + 7]))
+        events.should.equal([PasteEvent("x" * 1000), KeyEvent("!")])
+
+    with it("decodes SGR mouse reports"):
+        self.decoder.decode(b"\x1b[<0;3;4M\x1b[<0;3;4m").should.equal([
+            MouseEvent(2, 3, 1, pressed=True),
+            MouseEvent(2, 3, 1, pressed=False),
+        ])
+
+    with it("coalesces a burst of mouse motion into its last position"):
+        data = b"".join(b"\x1b[<35;%d;1M" % x for x in range(1, 101))
+        self.decoder.decode(data).should.equal([MouseEvent(99, 0, 0, motion=True)])
+
+    with description("after receiving part of an escape sequence"):
+
+        with before.each:
+            self.events = self.decoder.decode(b"\x1b[1")
+
+        with it("holds the partial sequence back"):
+            self.events.should.equal([])
+            self.decoder.has_pending.should.be.true
+
+        with it("completes the sequence when the rest arrives"):
+            self.decoder.decode(b"5~").should.equal([KeyEvent("f5")])
+
+    with description("after receiving a lone escape"):
+
+        with before.each:
+            self.decoder.decode(b"\x1b")
+
+        with it("reports the escape key once the input is final"):
+            self.decoder.decode(b"", final=True).should.equal([KeyEvent("escape")])
+
+
+########################################################################################################################
+
+with description("InputReader:", "unit") as self:
+
+    with before.each:
+        self.read_fd, self.write_fd = os.pipe()
+        self.reader = InputReader(self.read_fd)
+
+    with after.each:
+        os.close(self.read_fd)
+        os.close(self.write_fd)
+
+    with it("decodes all the available input in one call"):
+        os.write(self.write_fd, b"ab\x1b[A")
+        self.reader.read_events().should.equal([KeyEvent("a"), KeyEvent("b"), KeyEvent("up")])
+
+    with it("returns nothing when no input is available"):
+        self.reader.read_events().should.equal([])
+
+    with it("leaves the terminal's input reporting alone unless asked"):
+        output = StringIO()
+        self.reader.start(mouse=False, paste=False, output=output).stop()
+        output.getvalue().should.equal("")
+
+    with it("turns off only the reporting it turned on"):
+        output = StringIO()
+        self.reader.start(mouse=False, paste=True, output=output).stop()
+        output.getvalue().should.equal("\x1b[?2004h\x1b[?2004l")
+
+    with description("after reading a lone escape"):
+
+        with before.each:
+            os.write(self.write_fd, b"\x1b")
+            self.events = self.reader.read_events()
+
+        with it("holds the escape back"):
+            self.events.should.equal([])
+
+        with it("reports the escape key once the escape delay runs out, without waiting for the full timeout"):
+            start = time.now()
+            self.reader.read_events(timeout=2).should.equal([KeyEvent("escape")])
+            (time.now() - start).should.be.lower_than(1)
+
+        with it("reports the escape key before input which arrives after the delay"):
+            time.sleep(self.reader.escape_delay * 2)
+            os.write(self.write_fd, b"j")
+            self.reader.read_events().should.equal([KeyEvent("escape"), KeyEvent("j")])
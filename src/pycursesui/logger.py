@@ -27,6 +27,49 @@ class LogLevel(Enum):
     ERROR = 4
 
 
+LEVEL_TAGS = {level: level.name.rjust(5) for level in LogLevel}
+
+
+########################################################################################################################
+
+class LogPrefixBuilder(object):
+    """LogPrefixBuilder creates the timestamp and level prefix for each log line, reusing text wherever it can."""
+
+    def __init__(self):
+        """Create a new LogPrefixBuilder."""
+        self._indents = {}
+        self._last_key = None
+        self._last_prefix = None
+        self._times = {}
+
+    # Public Methods ###############################################################################
+
+    def build(self, level, cumulative_time, delta_time, indent_count):
+        """Build the prefix for a line given its level, total elapsed time, and time since the last line."""
+        key = (time.humanize_cached(cumulative_time), time.humanize_cached(delta_time), level, indent_count)
+        if key == self._last_key:
+            return self._last_prefix
+
+        cumulative_text, delta_text = self._pad(key[0]), self._pad(key[1])
+        indent = self._indents.get(indent_count)
+        if indent is None:
+            indent = self._indents[indent_count] = INDENT_TEXT * indent_count
+
+        self._last_key = key
+        self._last_prefix = f"\n[{cumulative_text} (+{delta_text}) {LEVEL_TAGS[level]}]{indent} "
+        return self._last_prefix
+
+    # Private Methods ##############################################################################
+
+    def _pad(self, text):
+        padded = self._times.get(text)
+        if padded is None:
+            if len(self._times) >= time.HUMANIZE_CACHE_SIZE:
+                self._times.clear()
+            padded = self._times[text] = text.rjust(TIME_WIDTH)
+        return padded
+
+
 ########################################################################################################################
 
 class LogChannel(object):
@@ -41,6 +84,7 @@ class LogChannel(object):
 
         self._eraseable_text = None
         self._last_time = time.now()
+        self._prefix_builder = LogPrefixBuilder()
 
     # Public Methods ###############################################################################
 
@@ -73,34 +117,29 @@ class LogChannel(object):
 
         self.erase()
         text = entry() if callable(entry) else str(entry)
+        now = time.now()
+
+        chunks = []
         for message in text.splitlines():
-            self._write_message(level, message, append=append)
+            if not append:
+                chunks.append(self._build_prefix(level, now))
+            chunks.append(message)
             append = False
 
+        print("".join(chunks), file=self.stream, end="", flush=True)
         return self
 
     # Private Methods ##############################################################################
 
+    def _build_prefix(self, level, now):
+        delta_time, self._last_time = now - self._last_time, now
+        return self._prefix_builder.build(level, now - self.global_start_time, delta_time, self.indent_count)
+
     def _is_writable_level(self, level):
         if not isinstance(level, LogLevel):
             raise TypeError(f"level should be a LogLevel but was a {type(level)}")
         return level.value >= self.level.value
 
-    def _write_message(self, level, message, append=False):
-        if not append:
-            now = time.now()
-            cumulative_time = time.humanize(now - self.global_start_time).rjust(TIME_WIDTH)
-            delta_time = time.humanize(now - self._last_time).rjust(TIME_WIDTH)
-            self._last_time = now
-
-            level = level.name.rjust(5)
-            indent = INDENT_TEXT * self.indent_count
-            prefix = f"\n[{cumulative_time} (+{delta_time}) {level}]{indent} "
-        else:
-            prefix = ""
-
-        print(f"{prefix}{message}", file=self.stream, end="", flush=True)
-
 
 ########################################################################################################################
 
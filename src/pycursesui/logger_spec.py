@@ -0,0 +1,50 @@
+"""Unit tests for the Logger class."""
+
+import sure
+
+from io import StringIO
+from mamba import before, description, it
+
+from pycursesui import Logger, LogLevel
+from pycursesui.logger import LogPrefixBuilder
+
+__all__ = []
+assert sure  # prevent linter errors
+
+
+########################################################################################################################
+
+with description("LogPrefixBuilder:", "unit") as self:
+
+    with before.each:
+        self.builder = LogPrefixBuilder()
+
+    with it("builds the timestamp and level prefix"):
+        self.builder.build(LogLevel.INFO, 1.25, 0.0125, 0).should.equal("\n[  1.2s (+  12ms)  INFO] ")
+
+    with it("indents the prefix"):
+        self.builder.build(LogLevel.ERROR, 75, 22.95, 2).should.equal("\n[  1.2m (+ 22.9s) ERROR]         ")
+
+    with it("builds a new prefix when only the level changes"):
+        self.builder.build(LogLevel.INFO, 0.5, 0, 0)
+        self.builder.build(LogLevel.DEBUG, 0.5, 0, 0).should.equal("\n[ 500ms (+   0ms) DEBUG] ")
+
+
+with description("Logger:", "unit") as self:
+
+    with before.each:
+        self.stream = StringIO()
+        self.logger = Logger().add_channel("test", self.stream, LogLevel.DEBUG)
+
+    with it("writes a prefix before each line of a multi-line entry"):
+        self.logger.info("alpha\nbravo")
+        lines = self.stream.getvalue().splitlines()[1:]
+        [line[-len(" INFO] alpha"):] for line in lines].should.equal([" INFO] alpha", " INFO] bravo"])
+
+    with it("continues the last line when appending"):
+        self.logger.info("alpha").info(" bravo", append=True)
+        self.stream.getvalue().should.match(r"^\n\[.*INFO\] alpha bravo$")
+
+    with it("skips entries below the channel's level"):
+        self.logger.set_level(LogLevel.WARN).info("alpha")
+        self.stream.getvalue().should.equal("")
@@ -0,0 +1,346 @@
+"""Define the RenderServer and RenderClient classes."""
+
+import os
+import socket
+import struct
+import threading
+
+from multiprocessing import current_process
+from multiprocessing.connection import Client, Connection, answer_challenge, deliver_challenge, wait
+
+from pycursesui import AttributeMask, LogLevel, Session
+from pycursesui import time
+from typing import Callable, Union
+
+__all__ = ["RenderClient", "RenderServer"]
+
+
+########################################################################################################################
+
+DEFAULT_BATCH_SIZE = 256
+DEFAULT_FRAME_TIME = 1 / 30
+HANDSHAKE_TIMEOUT = 1.0
+
+COMMAND_LOG = "log"
+COMMAND_WRITE = "write"
+
+
+########################################################################################################################
+
+class RenderClient(object):
+    """
+    RenderClient collects draw commands and log records in a worker process and sends them to a RenderServer.
+
+    Commands are buffered locally and sent as a single batch whenever `flush` is called or the buffer reaches its batch
+    size, so a worker pays for one message per batch rather than one per write.
+    """
+
+    def __init__(self, connection=None, address: str=None, authkey: bytes=None, batch_size: int=DEFAULT_BATCH_SIZE):
+        """
+        Create a new RenderClient.
+
+        Arguments:
+            connection: an already-open connection to the server (e.g., one end of a `multiprocessing.Pipe`)
+            address: the path of the Unix socket the server is listening on (if no connection is given)
+            authkey: the authentication key expected by the server (defaults to the process's own authkey)
+            batch_size: the number of commands to buffer before sending them automatically
+        """
+        if (connection is None) == (address is None):
+            raise ValueError("exactly one of connection or address must be provided")
+        if not isinstance(batch_size, int) or batch_size < 1:
+            raise ValueError(f"batch_size must be a positive int, but was {batch_size!r}")
+
+        self.batch_size = batch_size
+        self._batch = []
+        if connection is None:
+            connection = Client(address, authkey=authkey if authkey is not None else current_process().authkey)
+        self._connection = connection
+
+    # Public Methods ###############################################################################
+
+    def close(self):
+        """Send any pending commands and close the connection to the server."""
+        if self._connection is None:
+            return
+
+        self.flush()
+        self._connection.close()
+        self._connection = None
+
+    def flush(self) -> "RenderClient":
+        """Send all pending commands to the server as a single batch."""
+        if self._batch:
+            batch, self._batch = self._batch, []
+            self._connection.send(batch)
+        return self
+
+    def log(self, level: LogLevel, entry) -> "RenderClient":
+        """Queue a log entry to be written to the server's logger."""
+        if not isinstance(level, LogLevel):
+            raise TypeError(f"level must be a LogLevel, but was a {type(level)}")
+
+        text = entry() if callable(entry) else str(entry)
+        return self._append((COMMAND_LOG, level, text))
+
+    def write(self, value: str, x: int, y: int, length: int=-1,
+              attributes: Union[AttributeMask, int]=None) -> "RenderClient":
+        """Queue a write to the server's window. The arguments are the same as those for `Window.write`."""
+        attributes = attributes.value if isinstance(attributes, AttributeMask) else attributes
+        return self._append((COMMAND_WRITE, value, x, y, length, attributes))
+
+    # Magic Methods ################################################################################
+
+    def __enter__(self) -> "RenderClient":
+        """Enter a client block."""
+        return self
+
+    def __exit__(self, type, value, traceback):
+        """Exit a client block, closing the connection."""
+        self.close()
+        return False
+
+    # Private Methods ##############################################################################
+
+    def _append(self, command: tuple) -> "RenderClient":
+        self._batch.append(command)
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+        return self
+
+
+########################################################################################################################
+
+class RenderServer(object):
+    """
+    RenderServer owns a Session and applies draw commands sent by RenderClients in other processes.
+
+    Every command received during a frame is applied to the session's window without refreshing, and the screen is
+    then updated once, so any number of workers can draw without corrupting the screen or forcing a refresh per write.
+    """
+
+    def __init__(self, session: Session, address: str=None, authkey: bytes=None):
+        """
+        Create a new RenderServer.
+
+        Arguments:
+            session: the running session whose window and logger will receive commands
+            address: the path of a Unix socket to listen on for clients (if any)
+            authkey: the authentication key clients must present (defaults to the process's own authkey, which is
+                inherited by any worker processes it starts)
+        """
+        if not isinstance(session, Session):
+            raise TypeError(f"session must be a Session, but was a {type(session)}")
+
+        self.address = address
+        self.authkey = authkey if authkey is not None else current_process().authkey
+        self.session = session
+
+        self._accept_thread = None
+        self._connections = []
+        self._listener = None
+        self._lock = threading.Lock()
+        self._running = False
+
+    # Properties ###################################################################################
+
+    @property
+    def connection_count(self) -> int:
+        """Get the number of clients currently connected to this server."""
+        with self._lock:
+            return len(self._connections)
+
+    @property
+    def is_running(self) -> bool:
+        """Get whether the server is currently running."""
+        return self._running
+
+    # Public Methods ###############################################################################
+
+    def add_connection(self, connection) -> "RenderServer":
+        """Register an already-open connection (e.g., one end of a `multiprocessing.Pipe`) as a client."""
+        with self._lock:
+            self._connections.append(connection)
+        return self
+
+    def process_frame(self, timeout: float=0) -> int:
+        """
+        Apply every command which has arrived from any client, then refresh the screen once.
+
+        A command which fails (e.g., a write outside the window) is logged and skipped so the rest of the frame is
+        still drawn.
+
+        Arguments:
+            timeout: the number of seconds to wait for the first command to arrive
+
+        Returns:
+            the number of commands applied
+        """
+        with self._lock:
+            connections = list(self._connections)
+
+        if not connections:
+            if timeout:
+                time.sleep(timeout)
+            return 0
+
+        count = 0
+        for connection in wait(connections, timeout):
+            try:
+                while connection.poll():
+                    for command in connection.recv():
+                        count += self._apply(command)
+            except (EOFError, OSError):
+                self._remove_connection(connection)
+            except Exception as e:
+                self.session.logger.error("could not read from a render client", e)
+                self._remove_connection(connection)
+
+        self.session.window.refresh()
+        return count
+
+    def serve(self, frame_time: float=DEFAULT_FRAME_TIME, until: Callable=None) -> "RenderServer":
+        """
+        Process frames until the server is stopped or the `until` callable returns True.
+
+        Arguments:
+            frame_time: the minimum number of seconds between screen updates
+            until: a callable checked before each frame which ends the loop when it returns True
+        """
+        if not self.is_running:
+            self.start()
+
+        while self.is_running and not (until is not None and until()):
+            frame_start = time.now()
+            self.process_frame(timeout=frame_time)
+
+            remaining = frame_time - (time.now() - frame_start)
+            if remaining > 0:
+                time.sleep(remaining)
+
+        return self
+
+    def start(self) -> "RenderServer":
+        """Start accepting clients on this server's address (if it has one)."""
+        if self._running:
+            return self
+
+        self._running = True
+        if self.address is not None:
+            self.session.logger.info(f"Starting render server on {self.address}")
+            self._listener = socket.socket(socket.AF_UNIX)
+            self._listener.bind(self.address)
+            self._listener.listen()
+            self._accept_thread = threading.Thread(target=self._accept_clients, daemon=True)
+            self._accept_thread.start()
+
+        return self
+
+    def stop(self) -> "RenderServer":
+        """Stop accepting clients and close all existing connections."""
+        if not self._running:
+            return self
+
+        self._running = False
+        if self._listener is not None:
+            self.session.logger.info("Shutting down render server")
+            self._attempt(lambda: self._wake_accept_thread())
+            self._accept_thread.join(HANDSHAKE_TIMEOUT * 2)
+            self._attempt(lambda: self._listener.close())
+            self._attempt(lambda: os.unlink(self.address))
+            self._listener, self._accept_thread = None, None
+
+        with self._lock:
+            connections, self._connections = self._connections, []
+        for connection in connections:
+            self._attempt(lambda: connection.close())
+
+        return self
+
+    # Magic Methods ################################################################################
+
+    def __enter__(self) -> "RenderServer":
+        """Enter a server block."""
+        return self.start()
+
+    def __exit__(self, type, value, traceback):
+        """Exit a server block."""
+        self.stop()
+        return False
+
+    # Private Methods ##############################################################################
+
+    def _accept_clients(self):
+        while self._running:
+            try:
+                client_socket, _ = self._listener.accept()
+            except Exception as e:
+                if self._running:
+                    self.session.logger.error("could not accept a render client", e)
+                continue
+
+            with client_socket:
+                connection = self._authenticate(client_socket) if self._running else None
+            if connection is None:
+                continue
+
+            if self._running:
+                self.add_connection(connection)
+            else:
+                connection.close()
+
+    def _apply(self, command: tuple) -> int:
+        try:
+            kind = command[0]
+            if kind == COMMAND_WRITE:
+                _, value, x, y, length, attributes = command
+                self.session.window.write(value, x, y, length, attributes, refresh=False)
+            elif kind == COMMAND_LOG:
+                _, level, text = command
+                self.session.logger.write(level, text)
+            else:
+                raise ValueError(f"unknown render command: {kind!r}")
+        except Exception as e:
+            self.session.logger.error(f"could not apply render command {command!r}", e)
+            return 0
+
+        return 1
+
+    def _authenticate(self, client_socket: socket.socket) -> Connection:
+        # the timeout makes a client which never answers the challenge fail the handshake instead of stalling the
+        # accept thread, which would keep other clients out and stop `stop` from returning
+        self._set_receive_timeout(client_socket, HANDSHAKE_TIMEOUT)
+        connection = Connection(os.dup(client_socket.fileno()))
+        try:
+            deliver_challenge(connection, self.authkey)
+            answer_challenge(connection, self.authkey)
+        except Exception as e:
+            if self._running:
+                self.session.logger.warn(f"could not authenticate a render client: {e!r}")
+            connection.close()
+            return None
+
+        self._set_receive_timeout(client_socket, 0)
+        return connection
+
+    def _attempt(self, task: Callable):
+        try:
+            task()
+        except Exception:
+            pass
+
+    def _remove_connection(self, connection):
+        with self._lock:
+            if connection in self._connections:
+                self._connections.remove(connection)
+        self._attempt(lambda: connection.close())
+
+    def _set_receive_timeout(self, client_socket: socket.socket, timeout: float):
+        seconds = int(timeout)
+        microseconds = int((timeout - seconds) * 1000000)
+        client_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVTIMEO, struct.pack("ll", seconds, microseconds))
+
+    def _wake_accept_thread(self):
+        # a bare connection unblocks `accept`; it fails its handshake at once because it closes without answering
+        with socket.socket(socket.AF_UNIX) as wake:
+            wake.settimeout(HANDSHAKE_TIMEOUT)
+            wake.connect(self.address)
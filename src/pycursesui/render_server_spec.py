@@ -0,0 +1,140 @@
+"""Unit tests for the RenderServer and RenderClient classes."""
+
+import os
+import socket
+import sure
+import tempfile
+
+from io import StringIO
+from mamba import after, before, description, it
+from multiprocessing import AuthenticationError, Pipe
+from multiprocessing.connection import Client
+
+from pycursesui import Logger, RenderClient, RenderServer, Session
+from pycursesui import time
+from pycursesui.logger import LogLevel
+
+__all__ = []
+assert sure  # prevent linter errors
+
+
+########################################################################################################################
+
+with description("RenderServer:", "unit") as self:
+
+    with before.each:
+        self.session = None
+        try:
+            self.stdout = StringIO()
+            self.logger = Logger().add_channel("debug", self.stdout, LogLevel.DEBUG)
+            self.session = Session(self.logger).start()
+            if self.session is not None:
+                self.window = self.session.window
+                self.server = RenderServer(self.session).start()
+                server_end, client_end = Pipe()
+                self.server.add_connection(server_end)
+                self.client = RenderClient(client_end)
+        except Exception as e:
+            print(f"log:\n>>>\n{self.stdout.getvalue()}\n<<<\n")
+            raise e
+
+    with after.each:
+        if self.session is not None:
+            self.server.stop()
+            self.window.raw.erase()
+            self.session.stop()
+
+    with description("after a client sends a batch of writes"):
+
+        with before.each:
+            self.client.write("alpha", 0, 0).write("bravo", 3, 0).flush()
+
+        with it("applies all the commands in a single frame"):
+            self.server.process_frame(timeout=1).should.equal(2)
+
+        with it("draws the commands in order"):
+            self.server.process_frame(timeout=1)
+            self.window.read(0, 0, 10).should.equal("alpbravo  ")
+
+    with description("after a client sends a log entry"):
+
+        with before.each:
+            self.client.log(LogLevel.INFO, "from a worker").flush()
+            self.server.process_frame(timeout=1)
+
+        with it("writes the entry to the session's logger"):
+            self.stdout.getvalue().should.contain("from a worker")
+
+    with description("after a client sends a command which fails"):
+
+        with before.each:
+            self.client.write("x", 0, 500).write("ok", 0, 0).flush()
+            self.count = self.server.process_frame(timeout=1)
+
+        with it("logs the failure"):
+            self.stdout.getvalue().should.contain("could not apply render command")
+
+        with it("still applies the rest of the batch"):
+            self.count.should.equal(1)
+            self.window.read(0, 0, 2).should.equal("ok")
+
+    with description("after a client closes its connection"):
+
+        with before.each:
+            self.client.close()
+            self.server.process_frame(timeout=1)
+
+        with it("no longer tracks the connection"):
+            self.server.connection_count.should.equal(0)
+
+    with description("listening on a socket"):
+
+        with before.each:
+            self.server.stop()
+            self.address = os.path.join(tempfile.mkdtemp(), "render.sock")
+            self.server = RenderServer(self.session, self.address).start()
+            self.client = RenderClient(address=self.address)
+
+        with after.each:
+            self.client.close()
+
+        with it("accepts clients which present the process's authkey"):
+            self.client.write("socket", 0, 0).flush()
+            while self.server.connection_count == 0:
+                self.server.process_frame(timeout=0.01)
+            self.server.process_frame(timeout=1)
+            self.window.read(0, 0, 6).should.equal("socket")
+
+        with it("rejects clients which present the wrong authkey"):
+            (lambda: Client(self.address, authkey=b"wrong")).should.throw(AuthenticationError)
+
+        with description("while a client has not answered the authentication challenge"):
+
+            with before.each:
+                self.silent = socket.socket(socket.AF_UNIX)
+                self.silent.connect(self.address)
+
+            with after.each:
+                self.silent.close()
+
+            with it("still accepts other clients"):
+                with RenderClient(address=self.address) as other:
+                    other.write("other", 0, 0)
+                    while self.server.connection_count < 2:
+                        self.server.process_frame(timeout=0.01)
+
+            with it("can still be stopped"):
+                start = time.now()
+                self.server.stop()
+                (time.now() - start).should.be.lower_than(3)
+
+        with description("after being stopped"):
+
+            with before.each:
+                self.server.stop()
+
+            with it("is no longer running"):
+                self.server.is_running.should.be.false
+
+            with it("no longer tracks any connections"):
+                self.server.connection_count.should.equal(0)
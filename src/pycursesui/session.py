@@ -2,7 +2,7 @@
 
 import curses
 
-from pycursesui import Logger, Window
+from pycursesui import InputReader, Logger, StyleSheet, Window
 from typing import Callable, Tuple
 
 __all__ = ["Session"]
@@ -13,13 +13,30 @@ __all__ = ["Session"]
 class Session(object):
     """Session sets up everything needed to begin working with curses."""
 
-    def __init__(self, logger=None):
-        """Create a new Session."""
+    def __init__(self, logger=None, style_sheet=None, mouse: bool=False, paste: bool=False):
+        """
+        Create a new Session.
+
+        Arguments:
+            logger: the logger used to report the session's progress (defaults to a new Logger)
+            style_sheet: the style sheet compiled when the session starts (defaults to an empty StyleSheet)
+            mouse: whether to ask the terminal for SGR mouse reports, which are read through the `input` property
+            paste: whether to ask the terminal for bracketed pastes, which are read through the `input` property
+        """
+        self._input = None
         self._window = None
         self.logger = logger
+        self.mouse = mouse
+        self.paste = paste
+        self.style_sheet = style_sheet
 
     # Properties ###################################################################################
 
+    @property
+    def input(self) -> InputReader:
+        """Get the reader used to receive batches of key, mouse, and paste events (if the session is running)."""
+        return self._input
+
     @property
     def is_running(self) -> bool:
         """Get whether the session is currently active."""
@@ -35,6 +52,18 @@ class Session(object):
         value = value if value is not None else Logger()
         self._logger = value
 
+    @property
+    def style_sheet(self) -> StyleSheet:
+        """Get the style sheet compiled when this session starts."""
+        return self._style_sheet
+
+    @style_sheet.setter
+    def style_sheet(self, value: StyleSheet):
+        value = value if value is not None else StyleSheet()
+        if not isinstance(value, StyleSheet):
+            raise TypeError(f"style_sheet must be a StyleSheet, but was a {type(value)}")
+        self._style_sheet = value
+
     @property
     def window(self) -> Window:
         """Get the window associated with this session (if any)."""
@@ -64,6 +93,14 @@ class Session(object):
         if error:
             self.logger.error("could not start color session", error)
             self._attempt(lambda: curses.endwin())
+        else:
+            _, error = self._attempt(lambda: curses.use_default_colors())
+            if error:
+                self.logger.error("could not use the terminal's default colors", error)
+
+            _, error = self._attempt(lambda: self.style_sheet.compile())
+            if error:
+                self.logger.error("could not compile the style sheet", error)
 
         _, error = self._attempt(lambda: curses.noecho())
         if error:
@@ -86,11 +123,18 @@ class Session(object):
             self._attempt(lambda: curses.echo())
             self._attempt(lambda: curses.endwin())
 
+        self._input, error = self._attempt(lambda: InputReader().start(mouse=self.mouse, paste=self.paste))
+        if error:
+            self.logger.error("Could not set up input reader", error)
+
         return self
 
     def stop(self) -> "Session":
         """Stop the current session."""
         self.logger.info("Shutting down curses session")
+        if self._input is not None:
+            self._attempt(lambda: self._input.stop())
+            self._input = None
         self._attempt(lambda: self.window.raw.keypad(False))
         self._attempt(lambda: curses.nocbreak())
         self._attempt(lambda: curses.echo())
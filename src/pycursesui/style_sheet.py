@@ -0,0 +1,206 @@
+"""Define the Style and StyleSheet classes."""
+
+import curses
+
+from typing import Dict, Set, Union
+
+__all__ = ["Style", "StyleSheet"]
+
+
+########################################################################################################################
+
+COLORS = {
+    "default": -1,
+    "black": curses.COLOR_BLACK,
+    "blue": curses.COLOR_BLUE,
+    "cyan": curses.COLOR_CYAN,
+    "green": curses.COLOR_GREEN,
+    "magenta": curses.COLOR_MAGENTA,
+    "red": curses.COLOR_RED,
+    "white": curses.COLOR_WHITE,
+    "yellow": curses.COLOR_YELLOW,
+}
+
+FLAGS = {
+    "blink": curses.A_BLINK,
+    "bold": curses.A_BOLD,
+    "dim": curses.A_DIM,
+    "reverse": curses.A_REVERSE,
+    "standout": curses.A_STANDOUT,
+    "underline": curses.A_UNDERLINE,
+}
+
+
+########################################################################################################################
+
+class Style(object):
+    """Style declares the flags and colors used to draw a certain kind of text."""
+
+    def __init__(self, foreground: Union[str, int]="default", background: Union[str, int]="default", **flags):
+        """
+        Create a new Style.
+
+        Arguments:
+            foreground: the name or curses number of the text color ("default" keeps the terminal's color)
+            background: the name or curses number of the background color ("default" keeps the terminal's color)
+            flags: any of blink, bold, dim, reverse, standout, or underline set to True
+        """
+        unknown_flags = set(flags) - set(FLAGS)
+        if unknown_flags:
+            raise ValueError(f"unknown style flags: {', '.join(sorted(unknown_flags))}")
+
+        self.background = self._resolve_color("background", background)
+        self.flags = {name for name, value in flags.items() if value}
+        self.foreground = self._resolve_color("foreground", foreground)
+
+    # Properties ###################################################################################
+
+    @property
+    def flag_value(self) -> int:
+        """Get the combined value of this style's flags, without any color."""
+        value = curses.A_NORMAL
+        for name in self.flags:
+            value |= FLAGS[name]
+        return value
+
+    # Private Methods ##############################################################################
+
+    def _resolve_color(self, label: str, color: Union[str, int]) -> int:
+        if isinstance(color, str):
+            if color not in COLORS:
+                raise ValueError(f"{label} must be one of {', '.join(sorted(COLORS))}, but was {color!r}")
+            return COLORS[color]
+        if not isinstance(color, int):
+            raise TypeError(f"{label} must be a str or an int, but was a {type(color)}")
+        if color < COLORS["default"]:
+            raise ValueError(f"{label} must not be less than {COLORS['default']}, but was {color}")
+        return color
+
+
+########################################################################################################################
+
+class StyleSheet(object):
+    """
+    StyleSheet maps style names to the attribute values used to draw them.
+
+    Styles are declared up front and compiled once (normally by `Session.start`) into a flat table of attribute ints,
+    so drawing code only needs a dictionary lookup. Switching themes recompiles the table and reports which styles
+    actually changed, so widgets can redraw only the text which uses them.
+    """
+
+    def __init__(self, styles: Dict[str, Style]=None):
+        """Create a new StyleSheet from a map of style names to styles."""
+        self._attributes = {}
+        self._compiled = False
+        self._pairs = {}
+        self._styles = {}
+
+        for name, style in (styles or {}).items():
+            self.define(name, style)
+
+    # Properties ###################################################################################
+
+    @property
+    def is_compiled(self) -> bool:
+        """Get whether the attribute table reflects the current styles."""
+        return self._compiled
+
+    # Public Methods ###############################################################################
+
+    def attribute(self, name: str) -> int:
+        """Get the compiled attribute value for a given style."""
+        if not self._compiled:
+            raise ValueError("the style sheet must be compiled before its attributes can be used")
+        if name not in self._attributes:
+            raise ValueError(f"{name} is not a style in this style sheet")
+        return self._attributes[name]
+
+    def compile(self) -> Set[str]:
+        """
+        Resolve every style into an attribute int, allocating curses color pairs as needed.
+
+        This must be called after curses has started color support (and, for "default" colors, after
+        `curses.use_default_colors`). A color pair keeps its number for as long as some style uses it, and pairs no
+        longer used by any style are freed for reuse. Every color is checked against the terminal before any pair is
+        changed, so a style the terminal cannot show raises a ValueError and leaves the existing pairs alone.
+
+        Returns:
+            the names of the styles whose attribute values changed
+        """
+        self._allocate_pairs({(style.foreground, style.background) for style in self._styles.values()})
+
+        attributes = {}
+        for name, style in self._styles.items():
+            pair = self._pairs.get((style.foreground, style.background), 0)
+            attributes[name] = style.flag_value | curses.color_pair(pair)
+
+        changed = {name for name in set(attributes) | set(self._attributes)
+                   if attributes.get(name) != self._attributes.get(name)}
+        self._attributes = attributes
+        self._compiled = True
+        return changed
+
+    def define(self, name: str, style: Style) -> "StyleSheet":
+        """Add or replace a named style. The style sheet must be recompiled before the change takes effect."""
+        if not isinstance(name, str):
+            raise TypeError(f"name must be a str, but was a {type(name)}")
+        if not isinstance(style, Style):
+            raise TypeError(f"style must be a Style, but was a {type(style)}")
+
+        self._styles[name] = style
+        self._compiled = False
+        return self
+
+    def has_style(self, name: str) -> bool:
+        """Determine whether this style sheet defines a certain style."""
+        return name in self._styles
+
+    def list_styles(self) -> list:
+        """List the names of all defined styles."""
+        return list(self._styles.keys())
+
+    def set_theme(self, styles: Dict[str, Style]) -> Set[str]:
+        """
+        Replace the given styles and recompile the attribute table.
+
+        If the new styles cannot be compiled, the error is raised and the previous theme stays in effect.
+
+        Returns:
+            the names of the styles whose attribute values changed
+        """
+        previous_styles, was_compiled = dict(self._styles), self._compiled
+        for name, style in styles.items():
+            self.define(name, style)
+
+        try:
+            return self.compile()
+        except Exception:
+            self._styles, self._compiled = previous_styles, was_compiled
+            raise
+
+    # Magic Methods ################################################################################
+
+    def __getitem__(self, name: str) -> int:
+        """Get the compiled attribute value for a given style."""
+        return self.attribute(name)
+
+    # Private Methods ##############################################################################
+
+    def _allocate_pairs(self, colors: Set[tuple]):
+        colors.discard((COLORS["default"], COLORS["default"]))
+        if len(colors) >= curses.COLOR_PAIRS:
+            raise ValueError(f"the terminal supports only {curses.COLOR_PAIRS - 1} color pairs")
+        for color in sorted({color for combination in colors for color in combination}):
+            if color >= curses.COLORS:
+                raise ValueError(f"the terminal supports only colors up to {curses.COLORS - 1}, but {color} was used")
+
+        pairs = {combination: pair for combination, pair in self._pairs.items() if combination in colors}
+        used, candidate = set(pairs.values()), 1
+        for foreground, background in sorted(colors - set(pairs)):
+            while candidate in used:
+                candidate += 1
+            curses.init_pair(candidate, foreground, background)
+            pairs[(foreground, background)] = candidate
+            used.add(candidate)
+
+        self._pairs = pairs
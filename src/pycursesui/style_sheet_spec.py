@@ -0,0 +1,88 @@
+"""Unit tests for the StyleSheet class."""
+
+import curses
+import sure
+
+from io import StringIO
+from mamba import after, before, description, it
+
+from pycursesui import Logger, Session, Style, StyleSheet
+from pycursesui.logger import LogLevel
+
+__all__ = []
+assert sure  # prevent linter errors
+
+
+########################################################################################################################
+
+with description("StyleSheet:", "unit") as self:
+
+    with before.each:
+        self.style_sheet = StyleSheet({
+            "alert": Style("red", underline=True),
+            "title": Style(bold=True),
+        })
+
+    with it("is not compiled before the session starts"):
+        self.style_sheet.is_compiled.should.be.false
+
+    with it("rejects colors below the terminal's default color"):
+        (lambda: Style(-2)).should.throw(ValueError)
+
+    with description("after being compiled by a session"):
+
+        with before.each:
+            self.session = None
+            try:
+                self.stdout = StringIO()
+                self.logger = Logger().add_channel("debug", self.stdout, LogLevel.DEBUG)
+                self.session = Session(self.logger, self.style_sheet).start()
+            except Exception as e:
+                print(f"log:\n>>>\n{self.stdout.getvalue()}\n<<<\n")
+                raise e
+
+        with after.each:
+            if self.session is not None:
+                self.session.stop()
+
+        with it("resolves each style to an attribute value"):
+            self.style_sheet.is_compiled.should.be.true
+            self.style_sheet["title"].should.equal(curses.A_BOLD)
+            (self.style_sheet["alert"] & curses.A_UNDERLINE).should.equal(curses.A_UNDERLINE)
+
+        with it("keeps the terminal's default color for colors left as default"):
+            pair = curses.pair_number(self.style_sheet["alert"])
+            curses.pair_content(pair).should.equal((curses.COLOR_RED, -1))
+
+        with it("reuses color pairs across many theme switches"):
+            for index in range(1, 64):
+                self.style_sheet.set_theme({"alert": Style(index % 8, (index // 8) % 8)})
+            curses.pair_number(self.style_sheet["alert"]).should.be.lower_than(3)
+
+        with description("after failing to switch to a color the terminal cannot show"):
+
+            with before.each:
+                self.alert = self.style_sheet["alert"]
+                self.pair_content = curses.pair_content(curses.pair_number(self.alert))
+                (lambda: self.style_sheet.set_theme({"alert": Style(curses.COLORS)})).should.throw(ValueError)
+
+            with it("keeps the previous theme"):
+                self.style_sheet.is_compiled.should.be.true
+                self.style_sheet["alert"].should.equal(self.alert)
+
+            with it("leaves the existing color pairs alone"):
+                curses.pair_content(curses.pair_number(self.alert)).should.equal(self.pair_content)
+
+        with description("after switching themes"):
+
+            with before.each:
+                self.changed = self.style_sheet.set_theme({
+                    "alert": Style("yellow", reverse=True),
+                    "title": Style(bold=True),
+                })
+
+            with it("reports only the styles which changed"):
+                self.changed.should.equal({"alert"})
+
+            with it("resolves the new attribute values"):
+                (self.style_sheet["alert"] & curses.A_REVERSE).should.equal(curses.A_REVERSE)
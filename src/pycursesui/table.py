@@ -0,0 +1,461 @@
+"""Define the Column and Table classes."""
+
+import curses
+
+from bisect import bisect_left, insort
+from itertools import count
+
+from pycursesui import AttributeMask, StyleSheet, Window
+from typing import Callable, Dict, Hashable, Iterable, List, Sequence, Tuple
+
+__all__ = ["Column", "Table"]
+
+
+########################################################################################################################
+
+COLUMN_SEPARATOR = " "
+
+
+########################################################################################################################
+
+class Column(object):
+    """Column describes how a single field of a Table's rows is titled, formatted, and sized."""
+
+    def __init__(self, title: str, width: int, formatter: Callable=None, style: str=None):
+        """
+        Create a new Column.
+
+        Arguments:
+            title: the text shown in the column's header
+            width: the number of characters the column occupies on screen
+            formatter: a callable which converts a cell's value into a string (defaults to `str`)
+            style: the name of the style sheet style used to draw the column's cells (if any)
+        """
+        if not isinstance(title, str):
+            raise TypeError(f"title must be a str, but was a {type(title)}")
+
+        self._width = 0
+        self.formatter = formatter if formatter is not None else str
+        self.style = style
+        self.title = title
+        self.width = width
+
+    # Properties ###################################################################################
+
+    @property
+    def width(self) -> int:
+        """Get the number of characters the column occupies on screen."""
+        return self._width
+
+    @width.setter
+    def width(self, value: int):
+        if not isinstance(value, int):
+            raise TypeError(f"width must be an int, but was a {type(value)}")
+        if value < 0:
+            raise ValueError(f"width must not be negative, but was {value}")
+
+        self._width = value
+
+    # Public Methods ###############################################################################
+
+    def format(self, value) -> str:
+        """Format a value as the padded and truncated text of one of this column's cells."""
+        return self.formatter(value)[0:self.width].ljust(self.width)
+
+
+########################################################################################################################
+
+class _Row(object):
+
+    __slots__ = ["entry", "values", "version"]
+
+    def __init__(self, values: Sequence, version: int, entry: tuple):
+        self.entry = entry
+        self.values = values
+        self.version = version
+
+
+########################################################################################################################
+
+class Table(object):
+    """
+    Table draws a large, sortable, and filterable set of rows into a rectangular region of a Window.
+
+    Only the rows and columns which fit into the region are ever formatted or drawn. Formatted cells are cached until
+    either their row or their column's width changes, and the sorted and filtered row order is maintained
+    incrementally, so changing a single row normally redraws only that row's line on the next call to `render`.
+    """
+
+    def __init__(self, columns: Sequence[Column], x: int, y: int, width: int, height: int, show_header: bool=True,
+                 header_attributes: AttributeMask=None, style_sheet: StyleSheet=None, header_style: str=None):
+        """
+        Create a new Table.
+
+        Arguments:
+            columns: the columns shown by the table
+            x: the x-coordinate of the table's upper-left corner
+            y: the y-coordinate of the table's upper-left corner
+            width: the number of characters available for each line
+            height: the number of lines available, including the header
+            show_header: whether the first line shows the column titles
+            header_attributes: the attributes used to draw the header (defaults to bold)
+            style_sheet: the compiled style sheet used to look up the header and column styles
+            header_style: the name of the style used to draw the header (overrides header_attributes)
+        """
+        if header_attributes is None:
+            header_attributes = AttributeMask()
+            header_attributes.bold = True
+
+        self.columns = list(columns)
+        self.header_attributes = header_attributes
+        self.header_style = header_style
+        self.show_header = show_header
+        self.style_sheet = style_sheet
+
+        self._cell_cache = {}
+        self._column_offset = 0
+        self._dirty_from = None
+        self._dirty_keys = set()
+        self._filter = None
+        self._header_dirty = True
+        self._needs_full_render = True
+        self._order = []
+        self._reverse = False
+        self._row_offset = 0
+        self._rows = {}
+        self._sequence = count()
+        self._sort_column = None
+        self._versions = count(1)
+
+        self.move(x, y, width, height)
+
+    # Properties ###################################################################################
+
+    @property
+    def body_height(self) -> int:
+        """Get the number of lines available for rows."""
+        return max(0, self.height - (1 if self.show_header else 0))
+
+    @property
+    def column_offset(self) -> int:
+        """Get the index of the left-most column shown."""
+        return self._column_offset
+
+    @column_offset.setter
+    def column_offset(self, value: int):
+        value = max(0, min(value, len(self.columns) - 1))
+        if value != self._column_offset:
+            self._column_offset = value
+            self.invalidate()
+
+    @property
+    def row_count(self) -> int:
+        """Get the number of rows which pass the current filter."""
+        return len(self._order)
+
+    @property
+    def row_offset(self) -> int:
+        """Get the index of the top-most row shown."""
+        return self._row_offset
+
+    @row_offset.setter
+    def row_offset(self, value: int):
+        value = max(0, min(value, len(self._order) - 1))
+        if value != self._row_offset:
+            self._row_offset = value
+            self.invalidate()
+
+    # Row Methods ##################################################################################
+
+    def get_row(self, key: Hashable) -> Sequence:
+        """Get the values of the row with the given key."""
+        return self._rows[key].values
+
+    def has_row(self, key: Hashable) -> bool:
+        """Determine whether this table has a row with the given key."""
+        return key in self._rows
+
+    def key_at(self, index: int) -> Hashable:
+        """Get the key of the row shown at a given index of the sorted and filtered order."""
+        return self._order[self._order_index(index, len(self._order))][-1]
+
+    def remove_row(self, key: Hashable) -> "Table":
+        """Remove the row with the given key (if present)."""
+        row = self._rows.pop(key, None)
+        if row is None:
+            return self
+
+        self._remove_entry(row.entry)
+        for index in range(len(self.columns)):
+            self._cell_cache.pop((key, index), None)
+        return self
+
+    def set_row(self, key: Hashable, values: Sequence) -> "Table":
+        """
+        Add a row or replace the values of an existing one.
+
+        If the row cannot be placed in the current order (e.g., its sort value cannot be compared with the others), the
+        error is raised and the table is left unchanged.
+        """
+        row = self._rows.get(key)
+        sequence = row.entry[-2] if row is not None else next(self._sequence)
+        entry = self._build_entry(key, values, sequence)
+
+        if row is None:
+            if self._passes_filter(values):
+                self._insert_entry(entry)
+            self._rows[key] = _Row(values, next(self._versions), entry)
+            return self
+
+        was_shown, is_shown = self._contains_entry(row.entry), self._passes_filter(values)
+        if was_shown and is_shown and row.entry == entry:
+            self._dirty_keys.add(key)
+        else:
+            self._replace_entry(row.entry if was_shown else None, entry if is_shown else None)
+
+        row.entry, row.values, row.version = entry, values, next(self._versions)
+        return self
+
+    def set_rows(self, rows: Iterable[Tuple[Hashable, Sequence]]) -> "Table":
+        """
+        Add or replace many rows at once, rebuilding the row order a single time.
+
+        If the new order cannot be built, the error is raised and none of the rows are changed.
+        """
+        updated_rows = dict(self._rows)
+        for key, values in rows:
+            row = updated_rows.get(key)
+            sequence = row.entry[-2] if row is not None else next(self._sequence)
+            updated_rows[key] = _Row(values, next(self._versions), self._build_entry(key, values, sequence))
+
+        order = self._build_order(updated_rows, self._filter)
+        self._rows = updated_rows
+        self._set_order(order)
+        return self
+
+    # Ordering Methods #############################################################################
+
+    def filter_by(self, predicate: Callable=None) -> "Table":
+        """Show only the rows whose values satisfy the predicate, or every row if the predicate is None."""
+        order = self._build_order(self._rows, predicate)
+        self._filter = predicate
+        self._set_order(order)
+        return self
+
+    def sort_by(self, column: int=None, reverse: bool=False) -> "Table":
+        """Order rows by the values of a given column index, or by insertion order if the column is None."""
+        if column is not None and not (0 <= column < len(self.columns)):
+            raise ValueError(f"column must be an index between 0 and {len(self.columns) - 1}, but was {column}")
+
+        previous_column, self._sort_column = self._sort_column, column
+        try:
+            rows = {key: _Row(row.values, row.version, self._build_entry(key, row.values, row.entry[-2]))
+                    for key, row in self._rows.items()}
+            order = self._build_order(rows, self._filter)
+        except Exception:
+            self._sort_column = previous_column
+            raise
+
+        self._reverse = bool(reverse)
+        self._rows = rows
+        self._set_order(order)
+        return self
+
+    # Drawing Methods ##############################################################################
+
+    def invalidate(self) -> "Table":
+        """Force every line of the table to be redrawn on the next render."""
+        self._needs_full_render = True
+        return self
+
+    def restyle(self, changed: Iterable[str]) -> "Table":
+        """
+        Mark the parts of the table drawn with any of the given styles to be redrawn on the next render.
+
+        Arguments:
+            changed: the names of the styles which changed (e.g., as returned by `StyleSheet.set_theme`)
+        """
+        changed = set(changed)
+        if self.header_style in changed:
+            self._header_dirty = True
+        if any(column.style in changed for _, column in self._visible_columns()):
+            self._mark_dirty_from(self._row_offset)
+        return self
+
+    def move(self, x: int, y: int, width: int, height: int) -> "Table":
+        """Change the region of the window occupied by the table."""
+        if width < 0 or height < 0:
+            raise ValueError(f"width and height must not be negative, but were {width} and {height}")
+
+        self.x, self.y, self.width, self.height = x, y, width, height
+        return self.invalidate()
+
+    def render(self, window: Window) -> int:
+        """
+        Draw every line of the table which has changed since the last render, and refresh the window once.
+
+        Returns:
+            the number of lines drawn
+        """
+        lines = self._collect_dirty_lines()
+        columns = self._visible_columns()
+
+        drawn = 0
+        if (self._needs_full_render or self._header_dirty) and self.show_header and self.height > 0:
+            attribute = self._header_attribute()
+            cells = [(column.format(column.title), attribute) for _, column in columns]
+            self._write_line(window, self.y, cells, attribute)
+            drawn += 1
+
+        top = self.y + (1 if self.show_header else 0)
+        attributes = [self._style_attribute(column.style) for _, column in columns]
+        for index in lines:
+            cells = []
+            if index < len(self._order):
+                cells = [(self._format_cell(index, i, c), a) for (i, c), a in zip(columns, attributes)]
+            self._write_line(window, top + index - self._row_offset, cells, curses.A_NORMAL)
+            drawn += 1
+
+        self._header_dirty = False
+        self._needs_full_render = False
+        self._dirty_from = None
+        self._dirty_keys.clear()
+
+        if drawn:
+            window.refresh()
+        return drawn
+
+    # Private Methods ##############################################################################
+
+    def _append_segment(self, segments: List[list], text: str, attribute: int):
+        if segments and segments[-1][1] == attribute:
+            segments[-1][0] += text
+        else:
+            segments.append([text, attribute])
+
+    def _build_entry(self, key: Hashable, values: Sequence, sequence: int) -> tuple:
+        if self._sort_column is None:
+            return (False, None, sequence, key)
+
+        value = values[self._sort_column]
+        return (value is None, value, sequence, key)
+
+    def _build_order(self, rows: Dict[Hashable, _Row], predicate: Callable) -> List[tuple]:
+        return sorted(row.entry for row in rows.values() if predicate is None or bool(predicate(row.values)))
+
+    def _collect_dirty_lines(self) -> List[int]:
+        first, last = self._row_offset, self._row_offset + self.body_height
+        if self._needs_full_render:
+            return list(range(first, last))
+
+        lines = set()
+        if self._dirty_from is not None:
+            lines.update(range(max(first, self._dirty_from), last))
+
+        total = len(self._order)
+        for key in self._dirty_keys:
+            row = self._rows.get(key)
+            if row is not None and self._contains_entry(row.entry):
+                index = self._order_index(bisect_left(self._order, row.entry), total)
+                if first <= index < last:
+                    lines.add(index)
+
+        return sorted(lines)
+
+    def _contains_entry(self, entry: tuple) -> bool:
+        index = bisect_left(self._order, entry)
+        return index < len(self._order) and self._order[index] == entry
+
+    def _format_cell(self, index: int, column_index: int, column: Column) -> str:
+        key = self.key_at(index)
+        row = self._rows[key]
+
+        cached = self._cell_cache.get((key, column_index))
+        if cached is not None and cached[0] == row.version and cached[1] == column.width:
+            return cached[2]
+
+        text = column.format(row.values[column_index])
+        self._cell_cache[(key, column_index)] = (row.version, column.width, text)
+        return text
+
+    def _header_attribute(self) -> int:
+        if self.header_style is not None:
+            return self._style_attribute(self.header_style)
+        return self.header_attributes.value
+
+    def _insert_entry(self, entry: tuple):
+        insort(self._order, entry)
+        self._mark_dirty_from(self._order_index(bisect_left(self._order, entry), len(self._order)))
+
+    def _mark_dirty_from(self, index: int):
+        self._dirty_from = index if self._dirty_from is None else min(self._dirty_from, index)
+
+    def _order_index(self, index: int, count: int) -> int:
+        return (count - 1 - index) if self._reverse else index
+
+    def _passes_filter(self, values: Sequence) -> bool:
+        return self._filter is None or bool(self._filter(values))
+
+    def _remove_entry(self, entry: tuple):
+        index = bisect_left(self._order, entry)
+        if index < len(self._order) and self._order[index] == entry:
+            self._mark_dirty_from(self._order_index(index, len(self._order)))
+            del self._order[index]
+
+    def _replace_entry(self, old_entry: tuple, new_entry: tuple):
+        if old_entry is not None:
+            self._remove_entry(old_entry)
+        if new_entry is None:
+            return
+
+        try:
+            self._insert_entry(new_entry)
+        except Exception:
+            if old_entry is not None:
+                self._insert_entry(old_entry)
+            raise
+
+    def _set_order(self, order: List[tuple]):
+        self._order = order
+        self._row_offset = max(0, min(self._row_offset, len(self._order) - 1))
+        self.invalidate()
+
+    def _style_attribute(self, name: str) -> int:
+        if name is None or self.style_sheet is None:
+            return curses.A_NORMAL
+        return self.style_sheet[name]
+
+    def _visible_columns(self) -> List[Tuple[int, Column]]:
+        columns, used = [], 0
+        for index in range(self._column_offset, len(self.columns)):
+            if used >= self.width:
+                break
+            column = self.columns[index]
+            columns.append((index, column))
+            used += column.width + len(COLUMN_SEPARATOR)
+        return columns
+
+    def _write_line(self, window: Window, y: int, cells: List[Tuple[str, int]], base_attribute: int):
+        segments = []
+        for index, (text, attribute) in enumerate(cells):
+            if index > 0:
+                self._append_segment(segments, COLUMN_SEPARATOR, base_attribute)
+            self._append_segment(segments, text, attribute)
+
+        used = sum(len(text) for text, _ in segments)
+        if used < self.width:
+            self._append_segment(segments, " " * (self.width - used), base_attribute)
+
+        max_y, max_x = window.raw.getmaxyx()
+        x, remaining = self.x, self.width
+        for text, attribute in segments:
+            if remaining <= 0:
+                break
+            text = text[0:remaining]
+            try:
+                window.write(text, x, y, attributes=attribute, refresh=False)
+            except curses.error:
+                # curses reports an error after drawing the bottom-right cell because the cursor cannot advance
+                if (y != max_y - 1) or (x + len(text) < max_x):
+                    raise
+            x, remaining = x + len(text), remaining - len(text)
@@ -0,0 +1,195 @@
+"""Unit tests for the Table class."""
+
+import curses
+import sure
+
+from io import StringIO
+from mamba import after, before, description, it
+
+from pycursesui import Column, Logger, Session, Style, StyleSheet, Table
+from pycursesui.logger import LogLevel
+
+__all__ = []
+assert sure  # prevent linter errors
+
+
+########################################################################################################################
+
+with description("Table:", "unit") as self:
+
+    with before.each:
+        self.session = None
+        try:
+            self.stdout = StringIO()
+            self.logger = Logger().add_channel("debug", self.stdout, LogLevel.DEBUG)
+            self.session = Session(self.logger).start()
+            if self.session is not None:
+                self.window = self.session.window
+        except Exception as e:
+            print(f"log:\n>>>\n{self.stdout.getvalue()}\n<<<\n")
+            raise e
+
+        self.table = Table([Column("name", 6), Column("size", 4)], 0, 0, 11, 4)
+        self.table.set_rows([("c", ["charlie", 3]), ("a", ["alpha", 1]), ("b", ["bravo", 2])])
+
+    with after.each:
+        if self.session is not None:
+            self.window.raw.erase()
+            self.session.stop()
+
+    with description("after the first render"):
+
+        with before.each:
+            self.lines_drawn = self.table.render(self.window)
+
+        with it("draws the header and every visible line"):
+            self.lines_drawn.should.equal(4)
+
+        with it("shows the rows in insertion order"):
+            self.window.read(0, 0, 11).should.equal("name   size")
+            self.window.read(0, 1, 11).should.equal("charli 3   ")
+            self.window.read(0, 2, 11).should.equal("alpha  1   ")
+            self.window.read(0, 3, 11).should.equal("bravo  2   ")
+
+        with description("after changing a single row in place"):
+
+            with before.each:
+                self.table.set_row("a", ["alpha", 9])
+
+            with it("redraws only that row's line"):
+                self.table.render(self.window).should.equal(1)
+                self.window.read(0, 2, 11).should.equal("alpha  9   ")
+
+        with description("after sorting by a column"):
+
+            with before.each:
+                self.table.sort_by(1).render(self.window)
+
+            with it("shows the rows in sorted order"):
+                self.table.key_at(0).should.equal("a")
+                self.window.read(0, 1, 11).should.equal("alpha  1   ")
+                self.window.read(0, 3, 11).should.equal("charli 3   ")
+
+            with description("after a row moves to a new position"):
+
+                with before.each:
+                    self.table.set_row("c", ["charlie", 0])
+
+                with it("redraws the lines from its new position onward"):
+                    self.table.render(self.window).should.equal(3)
+                    self.window.read(0, 1, 11).should.equal("charli 0   ")
+
+        with description("after filtering the rows"):
+
+            with before.each:
+                self.table.filter_by(lambda values: values[1] > 1).render(self.window)
+
+            with it("shows only the matching rows"):
+                self.table.row_count.should.equal(2)
+                self.window.read(0, 1, 11).should.equal("charli 3   ")
+                self.window.read(0, 2, 11).should.equal("bravo  2   ")
+                self.window.read(0, 3, 11).should.equal("           ")
+
+        with description("after scrolling to the second column"):
+
+            with before.each:
+                self.table.column_offset = 1
+                self.table.render(self.window)
+
+            with it("shows only the visible columns"):
+                self.window.read(0, 0, 11).should.equal("size       ")
+
+    with description("sorted by a column"):
+
+        with before.each:
+            self.table.sort_by(1)
+
+        with description("after failing to add a row whose sort value cannot be compared"):
+
+            with before.each:
+                (lambda: self.table.set_row("m", ["mike", "str"])).should.throw(TypeError)
+
+            with it("leaves the table unchanged"):
+                self.table.has_row("m").should.be.false
+                self.table.row_count.should.equal(3)
+
+        with description("after failing to change a row to a sort value which cannot be compared"):
+
+            with before.each:
+                (lambda: self.table.set_row("b", ["bravo", "str"])).should.throw(TypeError)
+
+            with it("leaves the table unchanged"):
+                self.table.get_row("b").should.equal(["bravo", 2])
+                [self.table.key_at(index) for index in range(3)].should.equal(["a", "b", "c"])
+
+    with description("after failing to sort by a column whose values cannot be compared"):
+
+        with before.each:
+            self.table.set_row("m", [None, "str"])
+            (lambda: self.table.sort_by(1)).should.throw(TypeError)
+
+        with it("keeps the previous order"):
+            [self.table.key_at(index) for index in range(4)].should.equal(["c", "a", "b", "m"])
+
+        with it("can still add rows"):
+            self.table.set_row("d", ["delta", 4])
+            self.table.row_count.should.equal(5)
+
+    with description("filling the entire screen"):
+
+        with before.each:
+            self.height, self.width = self.window.raw.getmaxyx()
+            self.table = Table([Column("name", self.width)], 0, 0, self.width, self.height)
+            self.table.set_rows((index, [f"row {index}"]) for index in range(self.height))
+
+        with it("draws every line, including the bottom-right corner"):
+            self.table.render(self.window).should.equal(self.height)
+            last_line = f"row {self.height - 2}".ljust(self.width)
+            self.window.read(0, self.height - 1, self.width).should.equal(last_line)
+
+    with description("drawn with a style sheet"):
+
+        with before.each:
+            self.style_sheet = StyleSheet({"alert": Style(underline=True), "header": Style(bold=True)})
+            self.style_sheet.compile()
+            columns = [Column("name", 6), Column("size", 4, style="alert")]
+            self.table = Table(columns, 0, 0, 11, 4, style_sheet=self.style_sheet, header_style="header")
+            self.table.set_rows([("a", ["alpha", 1]), ("b", ["bravo", 2])])
+            self.table.render(self.window)
+
+        with it("draws each column with its style"):
+            (self.window.raw.inch(1, 7) & curses.A_UNDERLINE).should.equal(curses.A_UNDERLINE)
+            (self.window.raw.inch(1, 0) & curses.A_UNDERLINE).should.equal(0)
+            (self.window.raw.inch(0, 0) & curses.A_BOLD).should.equal(curses.A_BOLD)
+
+        with description("after switching the theme of a column's style"):
+
+            with before.each:
+                changed = self.style_sheet.set_theme({"alert": Style(reverse=True)})
+                self.lines_drawn = self.table.restyle(changed).render(self.window)
+
+            with it("redraws only the body lines"):
+                self.lines_drawn.should.equal(3)
+
+            with it("draws the column with the new style"):
+                (self.window.raw.inch(1, 7) & curses.A_REVERSE).should.equal(curses.A_REVERSE)
+
+        with description("after switching the theme of the header's style"):
+
+            with before.each:
+                changed = self.style_sheet.set_theme({"header": Style(underline=True)})
+                self.lines_drawn = self.table.restyle(changed).render(self.window)
+
+            with it("redraws only the header"):
+                self.lines_drawn.should.equal(1)
+                (self.window.raw.inch(0, 0) & curses.A_UNDERLINE).should.equal(curses.A_UNDERLINE)
+
+        with description("after switching the theme of an unrelated style"):
+
+            with before.each:
+                self.style_sheet.define("other", Style(bold=True))
+                changed = self.style_sheet.compile()
+                self.lines_drawn = self.table.restyle(changed).render(self.window)
+
+            with it("draws nothing"):
+                self.lines_drawn.should.equal(0)
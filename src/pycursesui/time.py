@@ -3,13 +3,25 @@
 import math
 import time
 
+from fractions import Fraction
+
 __all__ = [
     "humanize",
+    "humanize_cached",
     "now",
     "sleep",
 ]
 
 
+########################################################################################################################
+
+HUMANIZE_CACHE_SIZE = 1024
+
+_MILLISECOND_CACHE = {}
+_MINUTE_CACHE = {}
+_SECOND_CACHE = {}
+
+
 # Public Methods #######################################################################################################
 
 def humanize(seconds):
@@ -25,6 +37,30 @@ def humanize(seconds):
         return "%0.1fs" % (seconds)
 
 
+def humanize_cached(seconds):
+    """
+    Convert a quantity of seconds into the same display as `humanize`, reusing the text built for earlier calls.
+
+    Seconds are grouped into buckets at the resolution of the display (milliseconds, or tenths of a second or minute),
+    so repeated calls which would show the same text only format it once. Infinite and NaN values have no bucket, so
+    they are passed straight to `humanize`.
+    """
+    if seconds is None:
+        return None
+    elif not math.isfinite(seconds):
+        return humanize(seconds)
+    elif seconds < 1:
+        bucket = math.trunc(seconds * 1000)
+        text = _MILLISECOND_CACHE.get(bucket)
+        if text is None:
+            text = _store(_MILLISECOND_CACHE, bucket, "%dms" % bucket)
+        return text
+    elif seconds > 60:
+        return _humanize_tenths(_MINUTE_CACHE, seconds / 60, "m")
+    else:
+        return _humanize_tenths(_SECOND_CACHE, seconds, "s")
+
+
 def now():
     """Return the current time as a number of seconds since the epoch start."""
     return time.perf_counter()
@@ -33,3 +69,30 @@ def now():
 def sleep(duration):
     """Cause the current thread to pause for the given number of seconds."""
     return time.sleep(duration)
+
+
+# Private Methods ######################################################################################################
+
+def _humanize_tenths(cache, value, suffix):
+    # `"%0.1f" % value` rounds the exact binary value (ties to even), so each bucket records where it rounds up
+    bucket = int(value * 10)
+    entry = cache.get(bucket)
+    if entry is None:
+        boundary = Fraction(2 * bucket + 1, 20)
+        threshold = float(boundary)
+        low_text, high_text = "%0.1f%s" % (bucket / 10, suffix), "%0.1f%s" % ((bucket + 1) / 10, suffix)
+        exact_threshold = Fraction(threshold)
+        rounds_up_at_threshold = (exact_threshold > boundary) or (exact_threshold == boundary and bucket % 2 == 1)
+        entry = _store(cache, bucket, (threshold, rounds_up_at_threshold, low_text, high_text))
+
+    threshold, rounds_up_at_threshold, low_text, high_text = entry
+    if (value > threshold) or (value == threshold and rounds_up_at_threshold):
+        return high_text
+    return low_text
+
+
+def _store(cache, key, value):
+    if len(cache) >= HUMANIZE_CACHE_SIZE:
+        cache.clear()
+    cache[key] = value
+    return value
@@ -0,0 +1,36 @@
+"""Unit tests for the time functions."""
+
+import sure
+
+from mamba import description, it
+
+from pycursesui import time
+
+__all__ = []
+assert sure  # prevent linter errors
+
+
+########################################################################################################################
+
+with description("time.humanize_cached:", "unit") as self:
+
+    with it("matches humanize across every display unit"):
+        for seconds in [0, 0.0015, 0.999, 1, 7.45, 22.95, 59.99, 60, 60.01, 105.0, 3600.5]:
+            time.humanize_cached(seconds).should.equal(time.humanize(seconds))
+
+    with it("matches humanize when a value falls exactly halfway between two tenths"):
+        for seconds in [1.25, 1.75, 2.75, 90.0, 105.0]:
+            time.humanize_cached(seconds).should.equal(time.humanize(seconds))
+
+    with it("matches humanize for values just below and above each rounding boundary"):
+        for tenth in range(10, 600):
+            for seconds in [tenth / 10 + 0.0499999, tenth / 10 + 0.05, tenth / 10 + 0.0500001]:
+                time.humanize_cached(seconds).should.equal(time.humanize(seconds))
+
+    with it("matches humanize for infinite and NaN values"):
+        time.humanize_cached(float("inf")).should.equal(time.humanize(float("inf")))
+        time.humanize_cached(float("nan")).should.equal(time.humanize(float("nan")))
+        (lambda: time.humanize_cached(float("-inf"))).should.throw(OverflowError)
+
+    with it("passes None through"):
+        time.humanize_cached(None).should.be.none
@@ -1,6 +1,9 @@
 """Define the Window class."""
 
+import curses
+
 from pycursesui import AttributeMask
+from typing import Union
 
 ########################################################################################################################
 
@@ -39,7 +42,14 @@ class Window(object):
         """Read a string from the screen at the given location."""
         return self.raw.instr(y, x, length).decode(ENCODING)
 
-    def write(self, value: str, x: int, y: int, length: int=-1, attributes: AttributeMask=None):
+    def refresh(self) -> "Window":
+        """Push all pending writes to the physical screen in a single update."""
+        self.raw.noutrefresh()
+        curses.doupdate()
+        return self
+
+    def write(self, value: str, x: int, y: int, length: int=-1, attributes: Union[AttributeMask, int]=None,
+              refresh: bool=True):
         """
         Write a portion of a string onto the window at a certain location.
 
@@ -48,13 +58,20 @@ class Window(object):
             x: the x-coordinate of where the first character should be placed
             y: the y-coordinate of where the first character should be placed
             length: the maximum number of characters to write
-            attributes: an Attributes object giving the attributes to be applied
+            attributes: an AttributeMask or precomputed attribute value (e.g., from a StyleSheet) to be applied
+            refresh: whether to update the screen immediately; pass False when batching several writes and call
+                `refresh` once afterwards
         """
-        attributes = attributes if attributes is not None else AttributeMask()
+        if attributes is None:
+            attributes = curses.A_NORMAL
+        elif isinstance(attributes, AttributeMask):
+            attributes = attributes.value
+
         if (length >= 0) and (len(value) > length):
             value = value[0:length]
 
-        self.raw.addstr(y, x, value, attributes.value)
-        self.raw.refresh()
+        self.raw.addstr(y, x, value, attributes)
+        if refresh:
+            self.raw.refresh()
 
         return self